@@ -9,13 +9,14 @@ from __future__ import annotations
 import asyncio
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
 
 from flakestorm import __version__
-from flakestorm.core.runner import FlakeStormRunner
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 # Create the main app
 app = typer.Typer(
@@ -25,13 +26,24 @@ app = typer.Typer(
     rich_markup_mode="rich",
 )
 
-console = Console()
+_console: Console | None = None
+
+
+def _get_console() -> Console:
+    """Get the shared console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
-        console.print(f"[bold blue]flakestorm[/bold blue] version {__version__}")
+        # Plain print so `--version` never has to set up a rich console
+        print(f"flakestorm version {__version__}")
         raise typer.Exit()
 
 
@@ -74,8 +86,12 @@ def init(
     Creates an flakestorm.yaml with sensible defaults that you can
     customize for your agent.
     """
+    from rich.panel import Panel
+
     from flakestorm.core.config import create_default_config
 
+    console = _get_console()
+
     if path.exists() and not force:
         console.print(
             f"[yellow]Configuration file already exists:[/yellow] {path}\n"
@@ -164,10 +180,13 @@ async def _run_async(
     quiet: bool,
 ) -> None:
     """Async implementation of the run command."""
+    from flakestorm.core.runner import FlakeStormRunner
     from flakestorm.reports.html import HTMLReportGenerator
     from flakestorm.reports.json_export import JSONReportGenerator
     from flakestorm.reports.terminal import TerminalReporter
 
+    console = _get_console()
+
     # Print header
     if not quiet:
         console.print()
@@ -264,6 +283,9 @@ def verify(
 
 async def _verify_async(config: Path) -> None:
     """Async implementation of verify command."""
+    from flakestorm.core.runner import FlakeStormRunner
+
+    console = _get_console()
 
     console.print()
     console.print("[bold blue]flakestorm[/bold blue] - Setup Verification")
@@ -319,6 +341,8 @@ def report(
     )
     from flakestorm.reports.terminal import TerminalReporter
 
+    console = _get_console()
+
     if not path.exists():
         console.print(f"[red]File not found:[/red] {path}")
         raise typer.Exit(1)
@@ -405,6 +429,9 @@ def score(
 
 async def _score_async(config: Path) -> None:
     """Async implementation of score command."""
+    from flakestorm.core.runner import FlakeStormRunner
+
+    console = _get_console()
 
     try:
         runner = FlakeStormRunner(
@@ -6,6 +6,8 @@ Features for integrating with external services:
 - Local embeddings for semantic similarity
 """
 
+import importlib
+
 # Import guards for optional dependencies
 
 __all__ = [
@@ -13,15 +15,25 @@ __all__ = [
     "LocalEmbedder",
 ]
 
+# Public name -> (module path, attribute) resolved on first access
+_LAZY_TARGETS: dict[str, tuple[str, str]] = {
+    "HuggingFaceModelProvider": (
+        "flakestorm.integrations.huggingface",
+        "HuggingFaceModelProvider",
+    ),
+    "LocalEmbedder": ("flakestorm.assertions.semantic", "LocalEmbedder"),
+}
+
 
 def __getattr__(name: str):
     """Lazy loading of integration modules."""
-    if name == "HuggingFaceModelProvider":
-        from flakestorm.integrations.huggingface import HuggingFaceModelProvider
+    try:
+        module_path, attr = _LAZY_TARGETS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
-        return HuggingFaceModelProvider
-    elif name == "LocalEmbedder":
-        from flakestorm.assertions.semantic import LocalEmbedder
+    obj = getattr(importlib.import_module(module_path), attr)
 
-        return LocalEmbedder
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the module so later lookups never reach __getattr__
+    globals()[name] = obj
+    return obj
@@ -10,25 +10,66 @@ Generates interactive HTML reports with:
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import io
 import json
+import math
+import os
+import uuid
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple, cast
 
-from jinja2 import Template
+from jinja2 import (
+    BytecodeCache,
+    DictLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+)
+from markupsafe import escape
 
 if TYPE_CHECKING:
     from flakestorm.reports.models import MutationResult, TestResults
 
+# orjson serializes the embedded mutation data in C; fall back to the
+# standard library when it isn't installed
+_ORJSON_AVAILABLE = False
+try:
+    import orjson
 
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>flakestorm Report - {{ report_date }}</title>
-    <style>
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+
+def _dumps_json(data: Any) -> str:
+    """
+    Serialize data to a JSON string.
+
+    Accepts the same inputs whether or not orjson is installed: data that
+    orjson rejects (such as integers wider than 64 bits) is handed to the
+    standard library instead.
+    """
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data)
+
+
+def _strip_indentation(source: str) -> str:
+    """Drop indentation and blank lines from embedded CSS or JavaScript."""
+    return "\n".join(line.strip() for line in source.splitlines() if line.strip())
+
+
+# Stylesheet is passed to the template as a value so Jinja never has to
+# lex the CSS braces
+_CSS = _strip_indentation(
+    """\
         :root {
             --bg-primary: #0a0a0f;
             --bg-secondary: #12121a;
@@ -410,7 +451,115 @@ HTML_TEMPLATE = """
             .stats-grid {
                 grid-template-columns: 1fr;
             }
+        }"""
+)
+
+# Detail-view script, passed in the same way so Jinja never scans it
+_JS = _strip_indentation(
+    """\
+        function escapeHtml(text) {
+            const div = document.createElement('div');
+            div.textContent = text;
+            return div.innerHTML;
         }
+
+        function showDetail(index) {
+            const m = mutations[index];
+            const modal = document.getElementById('detail-modal');
+            const body = document.getElementById('modal-body');
+
+            const hasRecommendation = m.recommendation && !m.passed;
+            
+            body.innerHTML = `
+                <div class="detail-section">
+                    <div class="detail-label">Original Prompt</div>
+                    <div class="detail-content">${escapeHtml(m.original_prompt)}</div>
+                </div>
+                <div class="detail-section">
+                    <div class="detail-label">Mutated (${m.mutation.type})</div>
+                    <div class="detail-content">${escapeHtml(m.mutation.mutated)}</div>
+                </div>
+                <div class="detail-section">
+                    <div class="detail-label">Agent Response</div>
+                    <div class="detail-content">${escapeHtml(m.response || '(empty)')}</div>
+                </div>
+                ${m.error ? `
+                <div class="detail-section">
+                    <div class="detail-label" style="color: var(--danger);">Error</div>
+                    <div class="detail-content" style="color: var(--danger);">${escapeHtml(m.error)}</div>
+                </div>
+                ` : ''}
+                <div class="detail-section">
+                    <div class="detail-label">Invariant Checks</div>
+                    <ul class="check-list">
+                        ${m.checks.map(c => `
+                            <li class="check-item">
+                                <div class="check-icon ${c.passed ? 'passed' : 'failed'}">
+                                    ${c.passed ? '✓' : '✗'}
+                                </div>
+                                <div class="check-details">
+                                    <div class="check-type">${escapeHtml(c.check_type)}</div>
+                                    <div class="check-message">${escapeHtml(c.details)}</div>
+                                </div>
+                            </li>
+                        `).join('')}
+                    </ul>
+                </div>
+                ${hasRecommendation ? `
+                <div class="detail-section" style="background: var(--bg-card); border-left: 4px solid 
+                    ${m.recommendation.priority === 'critical' ? 'var(--danger)' : 
+                      m.recommendation.priority === 'high' ? 'var(--warning)' : 'var(--accent)'};
+                    padding: 1rem; border-radius: 8px; margin-top: 1rem;">
+                    <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.75rem;">
+                        <div>
+                            <div style="text-transform: uppercase; font-size: 0.75rem; letter-spacing: 0.05em;
+                                color: ${m.recommendation.priority === 'critical' ? 'var(--danger)' : 
+                                         m.recommendation.priority === 'high' ? 'var(--warning)' : 'var(--accent)'};
+                                font-weight: 600; margin-bottom: 0.25rem;">
+                                ${m.recommendation.priority} Priority
+                            </div>
+                            <h4 style="margin: 0; font-size: 1.125rem; color: var(--text-primary);">
+                                💡 ${escapeHtml(m.recommendation.title)}
+                            </h4>
+                        </div>
+                    </div>
+                    <p style="color: var(--text-secondary); line-height: 1.6; margin-bottom: 1rem;">
+                        ${escapeHtml(m.recommendation.description)}
+                    </p>
+                    ${m.recommendation.code ? `
+                    <div style="background: var(--bg-primary); border-radius: 8px; padding: 1rem; overflow-x: auto;">
+                        <pre style="margin: 0; font-family: 'SF Mono', 'Fira Code', monospace; font-size: 0.875rem; line-height: 1.5; color: var(--text-primary);"><code>${escapeHtml(m.recommendation.code)}</code></pre>
+                    </div>
+                    ` : ''}
+                </div>
+                ` : ''}
+            `;
+
+            modal.classList.add('active');
+        }
+
+        function closeModal() {
+            document.getElementById('detail-modal').classList.remove('active');
+        }
+
+        document.getElementById('detail-modal').addEventListener('click', (e) => {
+            if (e.target.id === 'detail-modal') closeModal();
+        });
+
+        document.addEventListener('keydown', (e) => {
+            if (e.key === 'Escape') closeModal();
+        });"""
+)
+
+HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>flakestorm Report - {{ report_date }}</title>
+    <style>
+{{ css }}
     </style>
 </head>
 <body>
@@ -520,7 +669,7 @@ HTML_TEMPLATE = """
                         {% for issue in summary.top_issues %}
                         <div style="background: var(--bg-secondary); padding: 0.75rem; border-radius: 8px;">
                             <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.25rem;">
-                                {{ issue.type.replace('_', ' ').title() }}
+                                {{ issue.type.replace('_', ' ').title()|e }}
                             </div>
                             <div style="font-size: 1.25rem; font-weight: 600;">{{ issue.count }}</div>
                         </div>
@@ -555,17 +704,7 @@ HTML_TEMPLATE = """
         <div class="section">
             <h2 class="section-title">🔬 Mutation Results</h2>
             <div class="matrix-grid">
-                {% for result in mutations %}
-                <div class="matrix-cell {{ 'passed' if result.passed else 'failed' }}"
-                     onclick="showDetail({{ loop.index0 }})">
-                    <div class="mutation-type">{{ result.mutation.type }}</div>
-                    <div class="mutation-text">{{ result.mutation.mutated[:100] }}...</div>
-                    <div class="mutation-meta">
-                        <span>{{ result.latency_ms|round(0)|int }}ms</span>
-                        <span>{{ '✓' if result.passed else '✗' }}</span>
-                    </div>
-                </div>
-                {% endfor %}
+                {% for chunk in matrix_html %}{{ chunk }}{% endfor %}
             </div>
         </div>
     </div>
@@ -581,104 +720,188 @@ HTML_TEMPLATE = """
     </div>
 
     <script>
-        const mutations = {{ mutations_json|safe }};
+        const mutations = {% for chunk in mutations_data|json_stream %}{{ chunk }}{% endfor %};
 
-        function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }
+{{ js }}
+    </script>
+</body>
+</html>
+"""
 
-        function showDetail(index) {
-            const m = mutations[index];
-            const modal = document.getElementById('detail-modal');
-            const body = document.getElementById('modal-body');
 
-            const hasRecommendation = m.recommendation && !m.passed;
-            
-            body.innerHTML = `
-                <div class="detail-section">
-                    <div class="detail-label">Original Prompt</div>
-                    <div class="detail-content">${escapeHtml(m.original_prompt)}</div>
-                </div>
-                <div class="detail-section">
-                    <div class="detail-label">Mutated (${m.mutation.type})</div>
-                    <div class="detail-content">${escapeHtml(m.mutation.mutated)}</div>
-                </div>
-                <div class="detail-section">
-                    <div class="detail-label">Agent Response</div>
-                    <div class="detail-content">${escapeHtml(m.response || '(empty)')}</div>
-                </div>
-                ${m.error ? `
-                <div class="detail-section">
-                    <div class="detail-label" style="color: var(--danger);">Error</div>
-                    <div class="detail-content" style="color: var(--danger);">${escapeHtml(m.error)}</div>
-                </div>
-                ` : ''}
-                <div class="detail-section">
-                    <div class="detail-label">Invariant Checks</div>
-                    <ul class="check-list">
-                        ${m.checks.map(c => `
-                            <li class="check-item">
-                                <div class="check-icon ${c.passed ? 'passed' : 'failed'}">
-                                    ${c.passed ? '✓' : '✗'}
-                                </div>
-                                <div class="check-details">
-                                    <div class="check-type">${escapeHtml(c.check_type)}</div>
-                                    <div class="check-message">${escapeHtml(c.details)}</div>
-                                </div>
-                            </li>
-                        `).join('')}
-                    </ul>
-                </div>
-                ${hasRecommendation ? `
-                <div class="detail-section" style="background: var(--bg-card); border-left: 4px solid 
-                    ${m.recommendation.priority === 'critical' ? 'var(--danger)' : 
-                      m.recommendation.priority === 'high' ? 'var(--warning)' : 'var(--accent)'};
-                    padding: 1rem; border-radius: 8px; margin-top: 1rem;">
-                    <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.75rem;">
-                        <div>
-                            <div style="text-transform: uppercase; font-size: 0.75rem; letter-spacing: 0.05em;
-                                color: ${m.recommendation.priority === 'critical' ? 'var(--danger)' : 
-                                         m.recommendation.priority === 'high' ? 'var(--warning)' : 'var(--accent)'};
-                                font-weight: 600; margin-bottom: 0.25rem;">
-                                ${m.recommendation.priority} Priority
-                            </div>
-                            <h4 style="margin: 0; font-size: 1.125rem; color: var(--text-primary);">
-                                💡 ${escapeHtml(m.recommendation.title)}
-                            </h4>
-                        </div>
-                    </div>
-                    <p style="color: var(--text-secondary); line-height: 1.6; margin-bottom: 1rem;">
-                        ${escapeHtml(m.recommendation.description)}
-                    </p>
-                    ${m.recommendation.code ? `
-                    <div style="background: var(--bg-primary); border-radius: 8px; padding: 1rem; overflow-x: auto;">
-                        <pre style="margin: 0; font-family: 'SF Mono', 'Fira Code', monospace; font-size: 0.875rem; line-height: 1.5; color: var(--text-primary);"><code>${escapeHtml(m.recommendation.code)}</code></pre>
-                    </div>
-                    ` : ''}
-                </div>
-                ` : ''}
-            `;
+def _json_stream(items: Iterable[Any]) -> Iterator[str]:
+    """
+    Serialize items as a JSON array one element at a time.
 
-            modal.classList.add('active');
-        }
+    Used as a template filter so large result sets are written out
+    item by item rather than as one JSON string. Every "<" is written as
+    \\u003c (it can only occur inside JSON strings), so sequences such as
+    "</script>" or "<!--<script>" can't end or derail the surrounding
+    <script> element.
 
-        function closeModal() {
-            document.getElementById('detail-modal').classList.remove('active');
-        }
+    Args:
+        items: JSON-serializable items
 
-        document.getElementById('detail-modal').addEventListener('click', (e) => {
-            if (e.target.id === 'detail-modal') closeModal();
-        });
+    Yields:
+        Fragments that concatenate to the JSON array
+    """
+    yield "["
+    separator = ""
+    for item in items:
+        yield separator + _dumps_json(item).replace("<", "\\u003c")
+        separator = ","
+    yield "]"
 
-        document.addEventListener('keydown', (e) => {
-            if (e.key === 'Escape') closeModal();
-        });
-    </script>
-</body>
-</html>
-"""
+
+_TEMPLATE_NAME = "report.html"
+
+# Number of matrix cells buffered before a chunk is handed to the template.
+_MATRIX_CHUNK_CELLS = 256
+
+# Circumference of the score ring (SVG circle with r="78")
+_SCORE_RING_CIRCUMFERENCE = 2 * math.pi * 78
+
+
+# Options that affect the compiled template code. Autoescape is off: the
+# few values that can carry untrusted text are escaped once in Python (or
+# with an explicit |e) instead of running escape() on every substitution.
+# trim_blocks/lstrip_blocks drop the whitespace left around block tags.
+_ENV_OPTIONS: dict[str, Any] = {
+    "autoescape": False,
+    "trim_blocks": True,
+    "lstrip_blocks": True,
+}
+
+
+def _make_bytecode_cache() -> BytecodeCache | None:
+    """
+    Create the on-disk cache for compiled template code.
+
+    Lets later processes load the compiled report template instead of
+    recompiling it. Falls back to no cache if the per-user cache
+    directory can't be used.
+    """
+    # Jinja only checks the template source when reusing cached code, so
+    # the environment options are folded into the cache file name
+    options_key = hashlib.sha1(
+        repr(sorted(_ENV_OPTIONS.items())).encode(), usedforsecurity=False
+    ).hexdigest()[:12]
+    try:
+        return FileSystemBytecodeCache(
+            pattern=f"__flakestorm_report_{options_key}_%s.cache"
+        )
+    except (OSError, RuntimeError):
+        return None
+
+
+_env: Environment | None = None
+
+
+def _get_template() -> Template:
+    """
+    Get the compiled report template.
+
+    The environment (and its on-disk bytecode cache) is created on first
+    use rather than at import, so importing flakestorm never touches the
+    cache directory. The template is then served from the environment's
+    template cache for the rest of the process.
+    """
+    global _env
+    if _env is None:
+        _env = Environment(
+            loader=DictLoader({_TEMPLATE_NAME: HTML_TEMPLATE}),
+            auto_reload=False,
+            bytecode_cache=_make_bytecode_cache(),
+            **_ENV_OPTIONS,
+        )
+        _env.filters["json_stream"] = _json_stream
+    return _env.get_template(_TEMPLATE_NAME)
+
+
+class _MatrixCell(NamedTuple):
+    """Pre-computed, HTML-escaped values for one pass/fail matrix cell."""
+
+    mutation_type: str
+    snippet: str
+    latency_ms: int
+    passed: bool
+
+
+def _build_cells(mutations: Iterable[MutationResult]) -> Iterator[_MatrixCell]:
+    """
+    Build the pass/fail matrix cells for a set of mutation results.
+
+    Cells are yielded lazily so the matrix can be streamed without holding
+    one cell per mutation in memory. This loop runs once per mutation, so
+    it sticks to positional tuple construction and avoids repeated
+    attribute lookups.
+
+    Args:
+        mutations: Mutation results in report order
+
+    Yields:
+        One matrix cell per mutation result
+    """
+    for m in mutations:
+        mutation = m.mutation
+        snippet = mutation.mutated
+        if len(snippet) > 100:
+            snippet = snippet[:100] + "…"
+        yield _MatrixCell(
+            escape(mutation.type.value),
+            escape(snippet),
+            round(m.latency_ms),
+            m.passed,
+        )
+
+
+def _iter_matrix_html(cells: Iterable[_MatrixCell]) -> Iterator[str]:
+    """
+    Render the pass/fail matrix cells as HTML.
+
+    The matrix is the only part of the report that grows with the number
+    of mutations, so it is built outside Jinja as compact markup with no
+    indentation or line breaks. Cells are written into a single StringIO
+    buffer that is flushed every ``_MATRIX_CHUNK_CELLS`` cells, which
+    keeps memory bounded while streaming.
+
+    Args:
+        cells: Pre-computed, HTML-escaped matrix cells
+
+    Yields:
+        HTML for consecutive batches of cells, in order
+    """
+    buf = io.StringIO()
+    w = buf.write
+    for index, (mutation_type, snippet, latency_ms, passed) in enumerate(cells):
+        w('<div class="matrix-cell ')
+        w("passed" if passed else "failed")
+        w('" onclick="showDetail(')
+        w(str(index))
+        w(')"><div class="mutation-type">')
+        w(mutation_type)
+        w('</div><div class="mutation-text">')
+        w(snippet)
+        w('</div><div class="mutation-meta"><span>')
+        w(str(latency_ms))
+        w("ms</span><span>")
+        w("✓" if passed else "✗")
+        w("</span></div></div>")
+        if index % _MATRIX_CHUNK_CELLS == _MATRIX_CHUNK_CELLS - 1:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    if buf.tell():
+        yield buf.getvalue()
+
+
+class _TypeStatRow(NamedTuple):
+    """Pre-computed, HTML-escaped values for one per-type statistics row."""
+
+    mutation_type: str
+    total: int
+    passed: int
+    pass_rate_percent: float
 
 
 class HTMLReportGenerator:
@@ -697,7 +920,6 @@ class HTMLReportGenerator:
             results: Test results to generate report from
         """
         self.results = results
-        self.template = Template(HTML_TEMPLATE)
 
     def _generate_recommendation(
         self, mutation_result: Any
@@ -1059,61 +1281,95 @@ def validate_input(text):
             "recommendations": recommendations,
         }
 
-    def generate(self) -> str:
+    def _iter_mutations_data(self) -> Iterator[dict[str, Any]]:
         """
-        Generate the HTML report.
+        Yield mutation data with recommendations for the detail view.
+
+        Yields:
+            Serializable dictionary for each mutation result
+        """
+        for m in self.results.mutations:
+            mut_dict = m.to_dict()
+            if not m.passed:
+                mut_dict["recommendation"] = self._generate_recommendation(m)
+            yield mut_dict
+
+    def _build_context(self) -> dict[str, Any]:
+        """
+        Build the template context for the report.
 
         Returns:
-            Complete HTML document as a string
+            Keyword arguments for rendering the report template
         """
         stats = self.results.statistics
 
-        # Calculate score ring values
-        circumference = 2 * 3.14159 * 78
-        score_offset = circumference * (1 - stats.robustness_score)
+        # Calculate score ring offset
+        score_offset = _SCORE_RING_CIRCUMFERENCE * (1 - stats.robustness_score)
 
         # Prepare type stats
         type_stats = [
-            {
-                "mutation_type": t.mutation_type.replace("_", " "),
-                "total": t.total,
-                "passed": t.passed,
-                "pass_rate_percent": round(t.pass_rate * 100, 1),
-            }
+            _TypeStatRow(
+                mutation_type=escape(t.mutation_type.replace("_", " ")),
+                total=t.total,
+                passed=t.passed,
+                pass_rate_percent=round(t.pass_rate * 100, 1),
+            )
             for t in stats.by_type
         ]
 
-        # Prepare mutations data with recommendations
-        mutations_data = []
-        for m in self.results.mutations:
-            mut_dict = m.to_dict()
-            if not m.passed:
-                mut_dict["recommendation"] = self._generate_recommendation(m)
-            mutations_data.append(mut_dict)
+        # Prepare matrix cells
+        cells = _build_cells(self.results.mutations)
 
         # Generate summary
         summary = self._generate_summary()
 
-        return self.template.render(
-            report_date=self.results.started_at.strftime("%Y-%m-%d %H:%M:%S"),
-            duration=round(self.results.duration, 1),
-            circumference=circumference,
-            score_offset=score_offset,
-            score_percent=round(stats.robustness_score * 100, 1),
-            total_mutations=stats.total_mutations,
-            passed_mutations=stats.passed_mutations,
-            failed_mutations=stats.failed_mutations,
-            avg_latency=round(stats.avg_latency_ms),
-            type_stats=type_stats,
-            mutations=self.results.mutations,
-            mutations_json=json.dumps(mutations_data),
-            summary=summary,
-        )
+        return {
+            "css": _CSS,
+            "js": _JS,
+            "report_date": self.results.started_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "duration": round(self.results.duration, 1),
+            "circumference": _SCORE_RING_CIRCUMFERENCE,
+            "score_offset": score_offset,
+            "score_percent": round(stats.robustness_score * 100, 1),
+            "total_mutations": stats.total_mutations,
+            "passed_mutations": stats.passed_mutations,
+            "failed_mutations": stats.failed_mutations,
+            "avg_latency": round(stats.avg_latency_ms),
+            "type_stats": type_stats,
+            "matrix_html": _iter_matrix_html(cells),
+            # Serialized lazily by the json_stream filter during rendering
+            "mutations_data": self._iter_mutations_data(),
+            "summary": summary,
+        }
+
+    def generate(self) -> str:
+        """
+        Generate the HTML report.
+
+        Returns:
+            Complete HTML document as a string
+        """
+        return _get_template().render(**self._build_context())
+
+    def generate_stream(self, fh: BinaryIO) -> None:
+        """
+        Render the HTML report directly into an open file.
+
+        The document is written piece by piece as Jinja produces it, so
+        the full report never has to be held in memory.
+
+        Args:
+            fh: Binary file object to write the UTF-8 encoded report to
+        """
+        _get_template().stream(**self._build_context()).dump(fh, encoding="utf-8")
 
     def save(self, path: str | Path | None = None) -> Path:
         """
         Save the HTML report to a file.
 
+        Paths ending in ``.gz`` (e.g. ``report.html.gz``) are written
+        gzip-compressed.
+
         Args:
             path: Output path (default: auto-generated in reports dir)
 
@@ -1129,9 +1385,26 @@ def validate_input(text):
             path = output_dir / filename
         else:
             path = Path(path)
-            path.parent.mkdir(parents=True, exist_ok=True)
-
-        html = self.generate()
-        path.write_text(html, encoding="utf-8")
+            # Common case: the caller's directory already exists
+            if not path.parent.is_dir():
+                path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Render into a temporary file next to the target and move it into
+        # place on success, so a failed render never leaves a truncated
+        # report or clobbers an existing one
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            with tmp_path.open("xb") as fh:
+                if path.suffix == ".gz":
+                    with gzip.GzipFile(
+                        filename=path.name, mode="wb", compresslevel=6, fileobj=fh
+                    ) as gz:
+                        self.generate_stream(cast(BinaryIO, gz))
+                else:
+                    self.generate_stream(fh)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         return path
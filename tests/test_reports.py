@@ -1,6 +1,8 @@
 """Tests for report generation."""
 
+import gzip
 import json
+import re
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -10,6 +12,15 @@ import pytest
 from flakestorm.mutations.types import Mutation, MutationType
 
 
+@pytest.fixture(autouse=True)
+def isolated_template_cache(tmp_path, monkeypatch):
+    """Keep the compiled report template cache out of the real temp dir."""
+    from flakestorm.reports import html
+
+    monkeypatch.setattr(html, "_env", None)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+
 class TestCheckResult:
     """Tests for CheckResult data model."""
 
@@ -206,6 +217,8 @@ class TestTestResults:
             AgentConfig,
             AgentType,
             FlakeStormConfig,
+            InvariantConfig,
+            InvariantType,
         )
 
         return FlakeStormConfig(
@@ -214,7 +227,11 @@ class TestTestResults:
                 type=AgentType.HTTP,
             ),
             golden_prompts=["Test"],
-            invariants=[],
+            invariants=[
+                InvariantConfig(type=InvariantType.LATENCY, max_ms=2000),
+                InvariantConfig(type=InvariantType.VALID_JSON),
+                InvariantConfig(type=InvariantType.CONTAINS, value="ok"),
+            ],
         )
 
     @pytest.fixture
@@ -259,6 +276,8 @@ class TestHTMLReportGenerator:
             AgentConfig,
             AgentType,
             FlakeStormConfig,
+            InvariantConfig,
+            InvariantType,
         )
 
         return FlakeStormConfig(
@@ -267,7 +286,11 @@ class TestHTMLReportGenerator:
                 type=AgentType.HTTP,
             ),
             golden_prompts=["Test"],
-            invariants=[],
+            invariants=[
+                InvariantConfig(type=InvariantType.LATENCY, max_ms=2000),
+                InvariantConfig(type=InvariantType.VALID_JSON),
+                InvariantConfig(type=InvariantType.CONTAINS, value="ok"),
+            ],
         )
 
     @pytest.fixture
@@ -337,6 +360,18 @@ class TestHTMLReportGenerator:
         # Score should appear in some form (0.8 or 80%)
         assert "0.8" in html or "80" in html
 
+    def test_report_date_follows_started_at(self, sample_results):
+        """The report date reflects the current start time."""
+        from flakestorm.reports.html import HTMLReportGenerator
+
+        sample_results.started_at = datetime(2025, 1, 2, 3, 4, 5)
+        assert "2025-01-02 03:04:05" in HTMLReportGenerator(sample_results).generate()
+
+        sample_results.started_at = datetime(2025, 6, 7, 8, 9, 10)
+        html = HTMLReportGenerator(sample_results).generate()
+        assert "2025-06-07 08:09:10" in html
+        assert "2025-01-02 03:04:05" not in html
+
     def test_save_creates_file(self, sample_results):
         """save() creates file on disk."""
         from flakestorm.reports.html import HTMLReportGenerator
@@ -349,6 +384,169 @@ class TestHTMLReportGenerator:
             content = path.read_text()
             assert "html" in content.lower()
 
+    def test_save_gzip(self, sample_results):
+        """save() compresses the report when the path ends in .gz."""
+        from flakestorm.reports.html import HTMLReportGenerator
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generator = HTMLReportGenerator(sample_results)
+            path = generator.save(Path(tmpdir) / "report.html.gz")
+
+            with gzip.open(path, "rt", encoding="utf-8") as fh:
+                content = fh.read()
+            assert content == generator.generate()
+
+    def test_failed_save_keeps_existing_report(self, sample_results, monkeypatch):
+        """A render error leaves the previous report and no temp files."""
+        from flakestorm.reports.html import HTMLReportGenerator
+
+        def failing_mutations_data(self):
+            yield {"mutated": "partial"}
+            raise RuntimeError("render failed")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generator = HTMLReportGenerator(sample_results)
+            for name in ("report.html", "report.html.gz"):
+                path = generator.save(Path(tmpdir) / name)
+                previous = path.read_bytes()
+
+                with monkeypatch.context() as m:
+                    m.setattr(
+                        HTMLReportGenerator,
+                        "_iter_mutations_data",
+                        failing_mutations_data,
+                    )
+                    with pytest.raises(RuntimeError):
+                        generator.save(path)
+
+                assert path.read_bytes() == previous
+            assert sorted(p.name for p in Path(tmpdir).iterdir()) == [
+                "report.html",
+                "report.html.gz",
+            ]
+
+    def test_matrix_snippet_marks_truncation_only(self, sample_results):
+        """Matrix cells only append an ellipsis when the text was cut."""
+        from flakestorm.reports.html import HTMLReportGenerator
+        from flakestorm.reports.models import MutationResult
+
+        for mutated in ("short text", "x" * 150):
+            sample_results.mutations.append(
+                MutationResult(
+                    original_prompt="Test",
+                    mutation=Mutation(
+                        original="Test",
+                        mutated=mutated,
+                        type=MutationType.NOISE,
+                    ),
+                    response="ok",
+                    latency_ms=10.0,
+                    passed=True,
+                )
+            )
+
+        html = HTMLReportGenerator(sample_results).generate()
+
+        assert '<div class="mutation-text">short text</div>' in html
+        assert f'<div class="mutation-text">{"x" * 100}…</div>' in html
+
+    def test_matrix_renders_every_cell_across_chunks(self, sample_results):
+        """Matrix output spanning several buffer flushes keeps every cell."""
+        from flakestorm.reports.html import _MATRIX_CHUNK_CELLS, HTMLReportGenerator
+        from flakestorm.reports.models import MutationResult
+
+        count = _MATRIX_CHUNK_CELLS * 2 + 1
+        sample_results.mutations = [
+            MutationResult(
+                original_prompt="Test",
+                mutation=Mutation(
+                    original="Test",
+                    mutated=f"mutation {i}",
+                    type=MutationType.NOISE,
+                ),
+                response="ok",
+                latency_ms=10.0,
+                passed=True,
+            )
+            for i in range(count)
+        ]
+
+        html = HTMLReportGenerator(sample_results).generate()
+
+        assert html.count('<div class="matrix-cell ') == count
+        assert (
+            '<div class="matrix-cell passed" onclick="showDetail(0)">'
+            '<div class="mutation-type">noise</div>'
+            '<div class="mutation-text">mutation 0</div>'
+            '<div class="mutation-meta"><span>10ms</span><span>✓</span></div>'
+            "</div>"
+        ) in html
+        assert f"showDetail({count - 1})" in html
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_metadata_serializes_with_and_without_orjson(
+        self, sample_results, monkeypatch, use_orjson
+    ):
+        """Mutation metadata renders the same whether or not orjson is used."""
+        from flakestorm.reports import html
+        from flakestorm.reports.models import MutationResult
+
+        if use_orjson and not html._ORJSON_AVAILABLE:
+            pytest.skip("orjson is not installed")
+        monkeypatch.setattr(html, "_ORJSON_AVAILABLE", use_orjson)
+
+        metadata = {"nested": {1: "int key"}, "big": 2**70}
+        sample_results.mutations.append(
+            MutationResult(
+                original_prompt="Test",
+                mutation=Mutation(
+                    original="Test",
+                    mutated="Test?",
+                    type=MutationType.NOISE,
+                    metadata=metadata,
+                ),
+                response="ok",
+                latency_ms=10.0,
+                passed=True,
+            )
+        )
+
+        report = html.HTMLReportGenerator(sample_results).generate()
+
+        embedded = re.search(r"const mutations = (.*);$", report, re.MULTILINE)
+        data = json.loads(embedded.group(1))
+        assert data[0]["mutation"]["metadata"] == {
+            "nested": {"1": "int key"},
+            "big": 2**70,
+        }
+
+    def test_mutation_text_cannot_close_script(self, sample_results):
+        """Embedded mutation data can't break out of the <script> block."""
+        from flakestorm.reports.html import HTMLReportGenerator
+        from flakestorm.reports.models import MutationResult
+
+        payloads = ["</script><script>alert(1)</script>", "<!--<script>"]
+        for payload in payloads:
+            sample_results.mutations.append(
+                MutationResult(
+                    original_prompt="Test",
+                    mutation=Mutation(
+                        original="Test",
+                        mutated=payload,
+                        type=MutationType.PROMPT_INJECTION,
+                    ),
+                    response="",
+                    latency_ms=10.0,
+                    passed=False,
+                )
+            )
+
+        html = HTMLReportGenerator(sample_results).generate()
+
+        embedded = re.search(r"const mutations = (.*);$", html, re.MULTILINE).group(1)
+        assert "<" not in embedded
+        assert [m["mutation"]["mutated"] for m in json.loads(embedded)] == payloads
+
 
 class TestJSONReportGenerator:
     """Tests for JSON report generation."""
@@ -360,6 +558,8 @@ class TestJSONReportGenerator:
             AgentConfig,
             AgentType,
             FlakeStormConfig,
+            InvariantConfig,
+            InvariantType,
         )
 
         return FlakeStormConfig(
@@ -368,7 +568,11 @@ class TestJSONReportGenerator:
                 type=AgentType.HTTP,
             ),
             golden_prompts=["Test"],
-            invariants=[],
+            invariants=[
+                InvariantConfig(type=InvariantType.LATENCY, max_ms=2000),
+                InvariantConfig(type=InvariantType.VALID_JSON),
+                InvariantConfig(type=InvariantType.CONTAINS, value="ok"),
+            ],
         )
 
     @pytest.fixture
@@ -442,6 +646,145 @@ class TestJSONReportGenerator:
             assert "statistics" in data
 
 
+class TestReportGenerators:
+    """Tests covering the HTML and JSON reports together."""
+
+    @pytest.fixture
+    def sample_config(self):
+        """Create sample config."""
+        from flakestorm.core.config import (
+            AgentConfig,
+            AgentType,
+            FlakeStormConfig,
+            InvariantConfig,
+            InvariantType,
+        )
+
+        return FlakeStormConfig(
+            agent=AgentConfig(
+                endpoint="http://localhost:8000/chat",
+                type=AgentType.HTTP,
+            ),
+            golden_prompts=["Test"],
+            invariants=[
+                InvariantConfig(type=InvariantType.LATENCY, max_ms=2000),
+                InvariantConfig(type=InvariantType.VALID_JSON),
+                InvariantConfig(type=InvariantType.CONTAINS, value="ok"),
+            ],
+        )
+
+    @pytest.fixture
+    def sample_statistics(self):
+        """Create sample statistics."""
+        from flakestorm.reports.models import TestStatistics
+
+        return TestStatistics(
+            total_mutations=10,
+            passed_mutations=8,
+            failed_mutations=2,
+            robustness_score=0.8,
+            avg_latency_ms=150.0,
+            p50_latency_ms=120.0,
+            p95_latency_ms=300.0,
+            p99_latency_ms=450.0,
+        )
+
+    @pytest.fixture
+    def sample_results(self, sample_config, sample_statistics):
+        """Create sample test results."""
+        from flakestorm.reports.models import TestResults
+
+        ts = datetime(2024, 1, 15, 12, 0, 0)
+        return TestResults(
+            config=sample_config,
+            started_at=ts,
+            completed_at=ts,
+            mutations=[],
+            statistics=sample_statistics,
+        )
+
+    def test_reports_follow_mutation_changes(self, sample_results):
+        """Mutations changed after a report is generated show up in the next."""
+        from flakestorm.reports.html import HTMLReportGenerator
+        from flakestorm.reports.json_export import JSONReportGenerator
+        from flakestorm.reports.models import MutationResult
+
+        def make_result(mutated):
+            return MutationResult(
+                original_prompt="Test",
+                mutation=Mutation(
+                    original="Test",
+                    mutated=mutated,
+                    type=MutationType.NOISE,
+                ),
+                response="ok",
+                latency_ms=10.0,
+                passed=True,
+            )
+
+        sample_results.mutations.append(make_result("first"))
+        JSONReportGenerator(sample_results).generate()
+        HTMLReportGenerator(sample_results).generate()
+
+        sample_results.mutations[0] = make_result("replaced")
+        sample_results.mutations.append(make_result("appended"))
+
+        data = json.loads(JSONReportGenerator(sample_results).generate())
+        assert [m["mutation"]["mutated"] for m in data["mutations"]] == [
+            "replaced",
+            "appended",
+        ]
+        html = HTMLReportGenerator(sample_results).generate()
+        embedded = json.loads(
+            re.search(r"const mutations = (.*);$", html, re.MULTILINE).group(1)
+        )
+        assert [m["mutation"]["mutated"] for m in embedded] == [
+            "replaced",
+            "appended",
+        ]
+
+
+class TestTemplateCache:
+    """Tests for the on-disk cache of the compiled report template."""
+
+    def test_fresh_environment_loads_cached_template(self, tmp_path, monkeypatch):
+        """A new environment reuses the compiled code instead of recompiling."""
+        from jinja2 import Environment
+
+        from flakestorm.reports import html
+
+        html._get_template()
+        assert list(tmp_path.rglob("__flakestorm_report_*.cache"))
+
+        def fail_compile(*args, **kwargs):
+            raise AssertionError("template was recompiled")
+
+        monkeypatch.setattr(html, "_env", None)
+        monkeypatch.setattr(Environment, "compile", fail_compile)
+        assert html._get_template().name == html._TEMPLATE_NAME
+
+    @pytest.mark.parametrize("error", [RuntimeError, OSError])
+    def test_cache_falls_back_to_none(self, monkeypatch, error):
+        """An unusable cache directory disables the cache."""
+        from flakestorm.reports import html
+
+        def unusable_cache(*args, **kwargs):
+            raise error("no cache directory")
+
+        monkeypatch.setattr(html, "FileSystemBytecodeCache", unusable_cache)
+        assert html._make_bytecode_cache() is None
+
+    def test_cache_name_depends_on_environment_options(self, monkeypatch):
+        """Changing an environment option never reuses stale compiled code."""
+        from flakestorm.reports import html
+
+        before = html._make_bytecode_cache().pattern
+        monkeypatch.setitem(html._ENV_OPTIONS, "trim_blocks", False)
+        after = html._make_bytecode_cache().pattern
+
+        assert before != after
+
+
 class TestTerminalReporter:
     """Tests for terminal output."""
 